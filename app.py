@@ -1,7 +1,18 @@
+import math
+import sys
+
+import numpy as np
+import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 
+from sequence_kernels import arithmetic_kernel, geometric_kernel
+
+# Set to False to show the arithmetic-only calculator without the sequence type selector
+ENABLE_GEOMETRIC_SEQUENCES = True
+
+@st.cache_data(max_entries=128)
 def calculate_arithmetic_sequence(first_term, common_difference, num_terms):
     """
     Calculate arithmetic sequence given first term, common difference, and number of terms.
@@ -12,14 +23,11 @@ def calculate_arithmetic_sequence(first_term, common_difference, num_terms):
         num_terms (int): Number of terms to generate
     
     Returns:
-        list: List of arithmetic sequence terms
+        numpy.ndarray: Array of arithmetic sequence terms
     """
-    sequence = []
-    for i in range(num_terms):
-        term = first_term + (i * common_difference)
-        sequence.append(term)
-    return sequence
+    return arithmetic_kernel(float(first_term), float(common_difference), int(num_terms))
 
+@st.cache_data(max_entries=128)
 def calculate_geometric_sequence(first_term, common_ratio, num_terms):
     """
     Calculate geometric sequence given first term, common ratio, and number of terms.
@@ -30,13 +38,23 @@ def calculate_geometric_sequence(first_term, common_ratio, num_terms):
         num_terms (int): Number of terms to generate
     
     Returns:
-        list: List of geometric sequence terms
+        numpy.ndarray: Array of geometric sequence terms
+    """
+    return geometric_kernel(float(first_term), float(common_ratio), int(num_terms))
+
+def calculate_arithmetic_series_sum(first_term, common_difference, num_terms):
+    """
+    Calculate the sum of a finite arithmetic series.
+    
+    Args:
+        first_term (float): The first term of the sequence
+        common_difference (float): The common difference between consecutive terms
+        num_terms (int): Number of terms to sum
+    
+    Returns:
+        float: Sum of the arithmetic series
     """
-    sequence = []
-    for i in range(num_terms):
-        term = first_term * (common_ratio ** i)
-        sequence.append(term)
-    return sequence
+    return num_terms * (2 * first_term + (num_terms - 1) * common_difference) / 2
 
 def calculate_geometric_series_sum(first_term, common_ratio, num_terms):
     """
@@ -52,8 +70,97 @@ def calculate_geometric_series_sum(first_term, common_ratio, num_terms):
     """
     if common_ratio == 1:
         return first_term * num_terms
-    else:
+    try:
         return first_term * (1 - common_ratio ** num_terms) / (1 - common_ratio)
+    except OverflowError:
+        # r^n left the float range, so the 1 in (1 - r^n) is negligible and the
+        # magnitude can be taken in log space: log|S| = log|a₁| + n·log|r| - log|1 - r|
+        if first_term == 0:
+            return 0.0
+        negative = (first_term < 0) != (common_ratio < 0 and num_terms % 2 == 0)
+        sign = -1.0 if negative else 1.0
+        log_magnitude = (math.log(abs(first_term)) + num_terms * math.log(abs(common_ratio))
+                         - math.log(abs(1 - common_ratio)))
+        if log_magnitude > math.log(sys.float_info.max):
+            return sign * math.inf
+        return sign * math.exp(log_magnitude)
+
+@st.cache_data(max_entries=128)
+def build_df(term_numbers, sequence):
+    """
+    Build the table of term numbers and term values for the Table View.
+    
+    Args:
+        term_numbers (numpy.ndarray): Term numbers 1 through n
+        sequence (numpy.ndarray): The sequence terms
+    
+    Returns:
+        pandas.DataFrame: Table with term number and value columns
+    """
+    return pd.DataFrame({
+        'Term Number (n)': term_numbers,
+        'Term Value (aₙ)': sequence
+    })
+
+@st.cache_data(max_entries=128)
+def build_line_fig(x_values, y_values, name):
+    """
+    Build the line plot for the Charts tab.
+    
+    Args:
+        x_values (numpy.ndarray): Term numbers for the x-axis
+        y_values (numpy.ndarray): Term values for the y-axis
+        name (str): Trace name, i.e. the sequence type
+    
+    Returns:
+        plotly.graph_objects.Figure: Line plot of the sequence
+    """
+    fig_line = go.Figure()
+    fig_line.add_trace(go.Scatter(
+        x=x_values,
+        y=y_values,
+        mode='lines+markers',
+        name=name,
+        line=dict(color='#1f77b4', width=3),
+        marker=dict(size=8, color='#ff7f0e')
+    ))
+    fig_line.update_layout(
+        title='Sequence Line Plot',
+        xaxis_title='Term Number (n)',
+        yaxis_title='Term Value (aₙ)',
+        height=400,
+        showlegend=False
+    )
+    return fig_line
+
+@st.cache_data(max_entries=128)
+def build_bar_fig(x_values, y_values, name):
+    """
+    Build the bar chart for the Charts tab.
+    
+    Args:
+        x_values (numpy.ndarray): Term numbers for the x-axis
+        y_values (numpy.ndarray): Term values for the y-axis
+        name (str): Trace name, i.e. the sequence type
+    
+    Returns:
+        plotly.graph_objects.Figure: Bar chart of the sequence
+    """
+    fig_bar = go.Figure()
+    fig_bar.add_trace(go.Bar(
+        x=x_values,
+        y=y_values,
+        name=name,
+        marker_color='#2ca02c'
+    ))
+    fig_bar.update_layout(
+        title='Sequence Bar Chart',
+        xaxis_title='Term Number (n)',
+        yaxis_title='Term Value (aₙ)',
+        height=400,
+        showlegend=False
+    )
+    return fig_bar
 
 def main():
     # App title and description
@@ -64,16 +171,19 @@ def main():
     st.markdown("---")
     
     # Create sequence type selector
-    st.subheader("Sequence Type")
-    sequence_type = st.radio(
-        "Choose sequence type:",
-        ["Arithmetic Sequence", "Geometric Sequence"],
-        horizontal=True,
-        help="Select whether to calculate arithmetic or geometric sequences"
-    )
-    
-    # Add some spacing
-    st.markdown("---")
+    if ENABLE_GEOMETRIC_SEQUENCES:
+        st.subheader("Sequence Type")
+        sequence_type = st.radio(
+            "Choose sequence type:",
+            ["Arithmetic Sequence", "Geometric Sequence"],
+            horizontal=True,
+            help="Select whether to calculate arithmetic or geometric sequences"
+        )
+        
+        # Add some spacing
+        st.markdown("---")
+    else:
+        sequence_type = "Arithmetic Sequence"
     
     # Create input section
     st.subheader("Input Parameters")
@@ -135,13 +245,19 @@ def main():
                 st.error("Number of terms cannot exceed 1000.")
                 return
             
-            # Calculate the sequence based on type
+            # Calculate the summary values in closed form based on type
             if sequence_type == "Arithmetic Sequence":
-                sequence = calculate_arithmetic_sequence(first_term, common_difference, num_terms)
-                series_sum = sum(sequence)  # Simple sum for arithmetic
+                last_term = first_term + (num_terms - 1) * common_difference
+                series_sum = calculate_arithmetic_series_sum(first_term, common_difference, num_terms)
             else:  # Geometric Sequence
-                sequence = calculate_geometric_sequence(first_term, common_ratio, num_terms)
+                if first_term == 0:
+                    last_term = 0.0
+                else:
+                    with np.errstate(over='ignore'):
+                        last_term = first_term * np.power(common_ratio, num_terms - 1)
                 series_sum = calculate_geometric_series_sum(first_term, common_ratio, num_terms)
+                if math.isinf(series_sum):
+                    st.warning("The series sum exceeds the floating-point range, so it is shown as infinity.")
             
             # Display results
             st.subheader("Results")
@@ -159,13 +275,22 @@ def main():
                 else:  # Geometric Sequence
                     st.markdown(f"**Recursive Formula:** a₁ = {first_term}, aₙ = aₙ₋₁ × {common_ratio}")
             
+            # Generate the terms shown by the List, Table and Charts tabs
+            if sequence_type == "Arithmetic Sequence":
+                sequence = calculate_arithmetic_sequence(first_term, common_difference, num_terms)
+            else:  # Geometric Sequence
+                sequence = calculate_geometric_sequence(first_term, common_ratio, num_terms)
+            
+            # Term numbers shared by the table and both charts
+            term_numbers = np.arange(1, num_terms + 1)
+            
             # Display sequence in multiple formats
             tab1, tab2, tab3, tab4 = st.tabs(["List View", "Table View", "Charts", "Summary"])
             
             with tab1:
                 st.markdown(f"**{sequence_type}:**")
                 # Display sequence as a formatted string
-                sequence_str = ", ".join([str(term) for term in sequence])
+                sequence_str = ", ".join(map(str, sequence.tolist()))
                 st.code(sequence_str, language=None)
                 
                 # Display series sum
@@ -173,11 +298,7 @@ def main():
             
             with tab2:
                 # Create a table with term number and value
-                import pandas as pd
-                df = pd.DataFrame({
-                    'Term Number (n)': range(1, num_terms + 1),
-                    'Term Value (aₙ)': sequence
-                })
+                df = build_df(term_numbers, sequence)
                 st.dataframe(df, width='stretch')
             
             with tab3:
@@ -189,58 +310,28 @@ def main():
                 
                 with chart_col1:
                     # Line chart
-                    fig_line = go.Figure()
-                    fig_line.add_trace(go.Scatter(
-                        x=list(range(1, num_terms + 1)),
-                        y=sequence,
-                        mode='lines+markers',
-                        name=sequence_type,
-                        line=dict(color='#1f77b4', width=3),
-                        marker=dict(size=8, color='#ff7f0e')
-                    ))
-                    fig_line.update_layout(
-                        title='Sequence Line Plot',
-                        xaxis_title='Term Number (n)',
-                        yaxis_title='Term Value (aₙ)',
-                        height=400,
-                        showlegend=False
-                    )
+                    fig_line = build_line_fig(term_numbers, sequence, sequence_type)
                     st.plotly_chart(fig_line, use_container_width=True)
                 
                 with chart_col2:
                     # Bar chart
-                    fig_bar = go.Figure()
-                    fig_bar.add_trace(go.Bar(
-                        x=list(range(1, num_terms + 1)),
-                        y=sequence,
-                        name=sequence_type,
-                        marker_color='#2ca02c'
-                    ))
-                    fig_bar.update_layout(
-                        title='Sequence Bar Chart',
-                        xaxis_title='Term Number (n)',
-                        yaxis_title='Term Value (aₙ)',
-                        height=400,
-                        showlegend=False
-                    )
+                    fig_bar = build_bar_fig(term_numbers, sequence, sequence_type)
                     st.plotly_chart(fig_bar, use_container_width=True)
                 
                 # Pattern analysis
                 st.markdown("**Pattern Analysis:**")
-                if len(sequence) > 1:
+                if num_terms > 1:
                     if sequence_type == "Arithmetic Sequence":
-                        differences = [sequence[i+1] - sequence[i] for i in range(len(sequence)-1)]
                         st.markdown(f"• **Common Difference:** {common_difference} (consistent across all terms)")
                         st.markdown(f"• **Sequence Type:** {'Increasing' if common_difference > 0 else 'Decreasing' if common_difference < 0 else 'Constant'}")
                         if num_terms >= 3:
-                            slope = (sequence[-1] - sequence[0]) / (num_terms - 1)
+                            slope = common_difference
                             st.markdown(f"• **Average Rate of Change:** {slope:.2f} per term")
                     else:  # Geometric Sequence
-                        ratios = [sequence[i+1] / sequence[i] if sequence[i] != 0 else 0 for i in range(len(sequence)-1)]
                         st.markdown(f"• **Common Ratio:** {common_ratio} (consistent across all terms)")
                         st.markdown(f"• **Sequence Type:** {'Increasing' if (common_ratio > 1 and first_term > 0) or (0 < common_ratio < 1 and first_term < 0) else 'Decreasing' if (0 < common_ratio < 1 and first_term > 0) or (common_ratio > 1 and first_term < 0) else 'Alternating' if common_ratio < 0 else 'Constant'}")
                         if num_terms >= 2:
-                            growth_factor = (abs(sequence[-1]) / abs(sequence[0])) ** (1/(num_terms-1)) if sequence[0] != 0 else 0
+                            growth_factor = abs(common_ratio) if first_term != 0 else 0
                             st.markdown(f"• **Growth Factor:** {growth_factor:.3f} per term")
             
             with tab4:
@@ -248,16 +339,16 @@ def main():
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
-                    st.metric("First Term", f"{sequence[0]}")
+                    st.metric("First Term", f"{first_term}")
                 
                 with col2:
-                    st.metric("Last Term", f"{sequence[-1]}")
+                    st.metric("Last Term", f"{last_term}")
                 
                 with col3:
                     st.metric("Sum of Series", f"{series_sum}")
                 
                 with col4:
-                    st.metric("Range", f"{sequence[-1] - sequence[0]}")
+                    st.metric("Range", f"{last_term - first_term}")
         
         except ValueError as e:
             st.error(f"Invalid input: {str(e)}")
@@ -278,6 +369,8 @@ def main():
         
         **Geometric Formula:** aₙ = a₁ × r^(n-1)
         
+        **Arithmetic Series Sum:** S = n × (2a₁ + (n-1)d) / 2
+        
         **Geometric Series Sum:** S = a₁ × (1 - r^n) / (1 - r) when r ≠ 1, or S = a₁ × n when r = 1
         
         Where:
@@ -0,0 +1,23 @@
+import numpy as np
+from numba import njit
+
+# These kernels live outside app.py because Streamlit re-executes the app
+# script on every rerun; as an imported module they are compiled (or loaded
+# from the on-disk cache) once per process and then reused via sys.modules.
+# The explicit signatures compile them eagerly when this module is imported.
+@njit("float64[:](float64, float64, int64)", cache=True)
+def arithmetic_kernel(first_term, common_difference, num_terms):
+    sequence = np.empty(num_terms)
+    for i in range(num_terms):
+        sequence[i] = first_term + i * common_difference
+    return sequence
+
+@njit("float64[:](float64, float64, int64)", cache=True)
+def geometric_kernel(first_term, common_ratio, num_terms):
+    if first_term == 0:
+        # Avoid 0 * inf = nan once r^i overflows
+        return np.zeros(num_terms)
+    sequence = np.empty(num_terms)
+    for i in range(num_terms):
+        sequence[i] = first_term * common_ratio ** float(i)
+    return sequence